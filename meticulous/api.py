@@ -1,5 +1,17 @@
-from dataclasses import dataclass
-from typing import IO, Any, Callable, Dict, List, Optional, Self, Union, get_args
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    Union,
+    get_args,
+)
 
 import requests
 import socketio
@@ -32,6 +44,12 @@ from .api_types import (
 )
 
 
+# Building a TypeAdapter compiles a pydantic-core schema, so build each one once
+@lru_cache(maxsize=None)
+def _type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
 @dataclass
 class ApiOptions:
     onStatus: Optional[Callable[[StatusData], None]] = None
@@ -44,31 +62,32 @@ class ApiOptions:
     onNotification: Optional[Callable[[NotificationData], None]] = None
     onProfileChange: Optional[Callable[[ProfileEvent], None]] = None
 
-    # Fetch the events name from the Callbacks parameter and save it
-    def __post_init__(self) -> None:
-        for field in self.__dataclass_fields__.values():
-            handler = getattr(self, field.name)
-            if handler:
-                # Get the field type from the Options of the Dataclass
-                field_args = get_args(field.type)
-                if field_args:
-                    # Step into the Optional
-                    handler_args = get_args(field_args[0])
-                    if handler_args:
-                        # Get the callbacks parameters
-                        parameter_types = handler_args[0]
-                        # Check the first parameters type to have a class variable _socketio_event
-                        if hasattr(parameter_types[0], "_socketio_event"):
-                            event_name = getattr(parameter_types[0], "_socketio_event")
-                            setattr(self, f"_{field.name}_event_name", event_name)
-
     def register_handlers(self, sio: socketio.Client) -> None:
-        for field in self.__dataclass_fields__.values():
-            handler = getattr(self, field.name)
+        for field_name, event_name in _handler_events(type(self)):
+            handler = getattr(self, field_name)
             if handler:
-                event_name = getattr(self, f"_{field.name}_event_name", None)
-                if event_name:
-                    sio.on(event_name, handler)
+                sio.on(event_name, handler)
+
+
+# Fetch the events name from the Callbacks parameter once per options class,
+# the mapping only depends on the field annotations
+@lru_cache(maxsize=None)
+def _handler_events(options_type: type) -> Tuple[Tuple[str, str], ...]:
+    events = []
+    for field in fields(options_type):
+        # Get the field type from the Options of the Dataclass
+        field_args = get_args(field.type)
+        if field_args:
+            # Step into the Optional
+            handler_args = get_args(field_args[0])
+            if handler_args:
+                # Get the callbacks parameters
+                parameter_types = handler_args[0]
+                # Check the first parameters type to have a class variable _socketio_event
+                if hasattr(parameter_types[0], "_socketio_event"):
+                    event_name = getattr(parameter_types[0], "_socketio_event")
+                    events.append((field.name, event_name))
+    return tuple(events)
 
 
 class Api:
@@ -97,23 +116,23 @@ class Api:
     def execute_action(self, action: ActionType) -> Union[ActionResponse, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/action/{action}")
         if response.status_code == 200:
-            return TypeAdapter(ActionResponse).validate_python(response.json())
+            return _type_adapter(ActionResponse).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def list_profiles(self) -> Union[List[PartialProfile], APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/profile/list")
         if response.status_code == 200:
-            return TypeAdapter(List[PartialProfile]).validate_python(response.json())
+            return _type_adapter(List[PartialProfile]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def fetch_all_profiles(self) -> Union[List[Profile], APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/profile/list?full=true")
         if response.status_code == 200:
-            return TypeAdapter(List[Profile]).validate_python(response.json())
+            return _type_adapter(List[Profile]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def save_profile(self, data: Profile) -> Union[ChangeProfileResponse, APIError]:
         response = self.session.post(
@@ -121,10 +140,10 @@ class Api:
             json=data.model_dump(exclude_none=True),
         )
         if response.status_code == 200:
-            return TypeAdapter(ChangeProfileResponse).validate_python(response.json())
+            return _type_adapter(ChangeProfileResponse).validate_python(response.json())
         else:
             print(response.json())
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def load_profile_from_json(self, data: Profile) -> Union[PartialProfile, APIError]:
         response = self.session.post(
@@ -132,39 +151,39 @@ class Api:
             json=data.model_dump(exclude_none=True),
         )
         if response.status_code == 200:
-            return TypeAdapter(PartialProfile).validate_python(response.json())
+            return _type_adapter(PartialProfile).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def load_profile_by_id(self, id: str) -> Union[PartialProfile, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/profile/load/{id}")
         if response.status_code == 200:
-            return TypeAdapter(PartialProfile).validate_python(response.json())
+            return _type_adapter(PartialProfile).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_profile(self, profile_id: str) -> Union[Profile, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/profile/get/{profile_id}")
         if response.status_code == 200:
-            return TypeAdapter(Profile).validate_python(response.json())
+            return _type_adapter(Profile).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def delete_profile(self, profile_id: str) -> Union[ChangeProfileResponse, APIError]:
         response = self.session.delete(
             f"{self.base_url}/api/v1/profile/delete/{profile_id}"
         )
         if response.status_code == 200:
-            return TypeAdapter(PartialProfile).validate_python(response.json())
+            return _type_adapter(PartialProfile).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_last_profile(self) -> Union[LastProfile, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/profile/last")
         if response.status_code == 200:
-            return TypeAdapter(LastProfile).validate_python(response.json())
+            return _type_adapter(LastProfile).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_notifications(
         self, acknowledged: bool
@@ -173,9 +192,9 @@ class Api:
             f"{self.base_url}/api/v1/notifications?acknowledged={acknowledged}"
         )
         if response.status_code == 200:
-            return TypeAdapter(List[Notification]).validate_python(response.json())
+            return _type_adapter(List[Notification]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def acknowledge_notification(
         self, data: AcknowledgeNotificationRequest
@@ -187,7 +206,7 @@ class Api:
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_settings(
         self, setting_name: Optional[str] = None
@@ -197,9 +216,9 @@ class Api:
         )
         response = self.session.get(url)
         if response.status_code == 200:
-            return TypeAdapter(Settings).validate_python(response.json())
+            return _type_adapter(Settings).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def update_setting(self, setting: PartialSettings) -> Union[Settings, APIError]:
         response = self.session.post(
@@ -207,9 +226,9 @@ class Api:
             json=setting.model_dump(exclude_none=True),
         )
         if response.status_code == 200:
-            return TypeAdapter(Settings).validate_python(response.json())
+            return _type_adapter(Settings).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def update_firmware(
         self, form_data: Dict[str, IO], esp_type: str = "esp32-s3"
@@ -220,14 +239,14 @@ class Api:
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_wifi_config(self) -> Union[WiFiConfig, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/wifi/config")
         if response.status_code == 200:
-            return TypeAdapter(WiFiConfig).validate_python(response.json())
+            return _type_adapter(WiFiConfig).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def set_wifi_config(self, data: PartialWiFiConfig) -> Union[WiFiConfig, APIError]:
         response = self.session.post(
@@ -235,9 +254,9 @@ class Api:
             json=data.model_dump(exclude_none=True),
         )
         if response.status_code == 200:
-            return TypeAdapter(WiFiConfig).validate_python(response.json())
+            return _type_adapter(WiFiConfig).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_wifi_qr_url(self) -> str:
         return f"{self.base_url}/api/v1/wifi/config/qr.png"
@@ -248,14 +267,14 @@ class Api:
         if response.headers.get("Content-Type") == "image/png":
             return response.content
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def list_available_wifi(self) -> Union[List[WiFiNetwork], APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/wifi/list")
         if response.status_code == 200:
-            return TypeAdapter(List[WiFiNetwork]).validate_python(response.json())
+            return _type_adapter(List[WiFiNetwork]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def connect_to_wifi(self, data: WiFiConnectRequest) -> Union[None, APIError]:
         response = self.session.post(
@@ -265,7 +284,7 @@ class Api:
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def delete_wifi(self, ssid: str) -> Union[None, APIError]:
         response = self.session.post(
@@ -274,39 +293,39 @@ class Api:
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def play_sound(self, sound: str) -> Union[None, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/sounds/play/{sound}")
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def list_sounds(self) -> Union[List[str], APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/sounds/list")
         if response.status_code == 200:
-            return TypeAdapter(List[str]).validate_python(response.json())
+            return _type_adapter(List[str]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def list_sound_themes(self) -> Union[List[str], APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/sounds/theme/list")
         if response.status_code == 200:
-            return TypeAdapter(List[str]).validate_python(response.json())
+            return _type_adapter(List[str]).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def get_sound_theme(self) -> Union[str, APIError]:
         response = self.session.get(f"{self.base_url}/api/v1/sounds/theme/get")
         if response.status_code == 200:
-            return TypeAdapter(str).validate_python(response.json())
+            return _type_adapter(str).validate_python(response.json())
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
 
     def set_sound_theme(self, theme: str) -> Union[None, APIError]:
         response = self.session.post(f"{self.base_url}/api/v1/sounds/theme/set/{theme}")
         if response.status_code == 200:
             return None
         else:
-            return TypeAdapter(APIError).validate_python(response.json())
+            return _type_adapter(APIError).validate_python(response.json())
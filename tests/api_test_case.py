@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import MagicMock
+
+from meticulous.api import Api
+
+_SESSION_METHODS = ("get", "post", "delete")
+
+
+class ApiTestCase(unittest.TestCase):
+    """Shares one Api per class with its session's get/post/delete mocked"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.api = Api(base_url="http://localhost:8080/")
+        # Shadow the session methods on the instance instead of patching the
+        # requests.Session class; deleting them restores the originals
+        for method in _SESSION_METHODS:
+            mock = MagicMock()
+            setattr(cls.api.session, method, mock)
+            setattr(cls, f"mock_{method}", mock)
+            cls.addClassCleanup(delattr, cls.api.session, method)
+
+    def setUp(self) -> None:
+        for method in _SESSION_METHODS:
+            getattr(self, f"mock_{method}").reset_mock(
+                return_value=True, side_effect=True
+            )
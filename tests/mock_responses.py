@@ -1,3 +1,29 @@
+from typing import Any
+
+from meticulous.profile import Profile
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response with the attributes Api reads"""
+
+    __slots__ = ("status_code", "_json", "content", "text")
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Any = None,
+        content: bytes = b"",
+        text: str = "",
+    ) -> None:
+        self.status_code = status_code
+        self._json = json_data
+        self.content = content
+        self.text = text
+
+    def json(self) -> Any:
+        return self._json
+
+
 MOCK_PROFILE_LIST_RESPONSE = [
     {
         "name": "Italian limbus",
@@ -117,3 +143,16 @@ MOCK_PROFILE_RESPONSE = {
     "display": {"image": "/api/v1/profile/image/ed03e12bb34fc419c5adfd7d993b50e7.png"},
     "last_changed": 1716585650.3912911,
 }
+
+MOCK_PROFILE_NOT_FOUND_RESPONSE = {"error": "Profile not found"}
+
+
+MOCK_INVALID_PROFILE_RESPONSE = {
+    "name": "Invalid Profile",
+    "id": 12345,  # ID should be a string (UUID format)
+    "author": "author_name",
+    # Missing required fields such as author_id, temperature, final_weight, stages
+}
+
+# Validated once at import so tests can compare against it without rebuilding
+MOCK_PROFILE_OBJECT = Profile.model_validate(MOCK_PROFILE_RESPONSE)
@@ -1,22 +1,18 @@
-import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, call
 
-from requests.models import Response
+from meticulous import APIError
+from meticulous.api import ApiOptions
+from .api_test_case import ApiTestCase
+from .mock_responses import (
+    FakeResponse,
+    MOCK_PROFILE_LIST_RESPONSE,
+    MOCK_PROFILE_NOT_FOUND_RESPONSE,
+)
 
-from meticulous import Api, APIError
-from .mock_responses import MOCK_PROFILE_LIST_RESPONSE
 
-
-class TestApi(unittest.TestCase):
-    def setUp(self) -> None:
-        self.api = Api(base_url="http://localhost:8080/")
-
-    @patch("requests.Session.get")
-    def test_list_profiles(self, mock_get: Mock) -> None:
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_PROFILE_LIST_RESPONSE
-        mock_get.return_value = mock_response
+class TestApi(ApiTestCase):
+    def test_list_profiles(self) -> None:
+        self.mock_get.return_value = FakeResponse(200, MOCK_PROFILE_LIST_RESPONSE)
         profiles = self.api.list_profiles()
 
         self.assertEqual(len(profiles), 3)
@@ -24,13 +20,9 @@ class TestApi(unittest.TestCase):
         self.assertEqual(profiles[1].display.accentColor, "#FF5733")
         self.assertEqual(profiles[2].id, "06050134-0680-408e-8fe4-60e7d329b136")
 
-    @patch("requests.Session.get")
-    def test_get_profile_not_found(self, mock_get: Mock) -> None:
+    def test_get_profile_not_found(self) -> None:
         # Set up the mock to return a 404 response
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"error": "Profile not found"}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = FakeResponse(404, MOCK_PROFILE_NOT_FOUND_RESPONSE)
 
         profile_id = "nonexistent-profile-id"
         result = self.api.get_profile(profile_id)
@@ -38,6 +30,14 @@ class TestApi(unittest.TestCase):
         self.assertIsInstance(result, APIError)
         self.assertEqual(result.error, "Profile not found")
 
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_register_handlers(self) -> None:
+        on_status = MagicMock()
+        on_button = MagicMock()
+        options = ApiOptions(onStatus=on_status, onButton=on_button)
+        sio = MagicMock()
+        options.register_handlers(sio)
+
+        self.assertEqual(
+            sio.on.call_args_list,
+            [call("status", on_status), call("button", on_button)],
+        )
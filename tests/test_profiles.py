@@ -1,23 +1,20 @@
-import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from requests.models import Response
+from pydantic import ValidationError
 
-from meticulous.api import Api
 from meticulous.profile import Profile
-from tests.mock_responses import MOCK_PROFILE_RESPONSE
+from tests.api_test_case import ApiTestCase
+from tests.mock_responses import (
+    FakeResponse,
+    MOCK_INVALID_PROFILE_RESPONSE,
+    MOCK_PROFILE_OBJECT,
+    MOCK_PROFILE_RESPONSE,
+)
 
 
-class TestProfile(unittest.TestCase):
-    def setUp(self) -> None:
-        self.api = Api(base_url="http://localhost:8080/")
-
-    @patch("requests.Session.get")
-    def test_get_profile(self, mock_get: Mock) -> None:
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_PROFILE_RESPONSE
-        mock_get.return_value = mock_response
+class TestProfile(ApiTestCase):
+    def test_get_profile(self) -> None:
+        self.mock_get.return_value = FakeResponse(200, MOCK_PROFILE_RESPONSE)
 
         profile_id = "05051ed3-9996-43e8-9da6-963f2b31d481"
         profile: Profile = self.api.get_profile(profile_id)
@@ -48,14 +45,14 @@ class TestProfile(unittest.TestCase):
             "/api/v1/profile/image/ed03e12bb34fc419c5adfd7d993b50e7.png",
         )
         self.assertEqual(profile.last_changed, 1716585650.3912911)
+        self.assertEqual(profile, MOCK_PROFILE_OBJECT)
 
-    @patch("requests.Session.get")
-    def test_get_profile_invalid_json(self, mock_get: Mock) -> None:
+    def test_get_profile_invalid_json(self) -> None:
         # Set up the mock to return invalid JSON
-        mock_response = Mock(spec=Response)
+        mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = mock_response
 
         profile_id = "05051ed3-9996-43e8-9da6-963f2b31d481"
         with self.assertRaises(ValueError) as context:
@@ -63,26 +60,12 @@ class TestProfile(unittest.TestCase):
 
         self.assertTrue("Invalid JSON" in str(context.exception))
 
-    @patch("requests.Session.get")
-    def test_get_profile_invalid_format(self, mock_get: Mock) -> None:
+    def test_get_profile_invalid_format(self) -> None:
         # Set up the mock to return JSON not adhering to the format
-        invalid_profile_response = {
-            "name": "Invalid Profile",
-            "id": 12345,  # ID should be a string (UUID format)
-            "author": "author_name",
-            # Missing required fields such as author_id, temperature, final_weight, stages
-        }
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = invalid_profile_response
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = FakeResponse(200, MOCK_INVALID_PROFILE_RESPONSE)
 
         profile_id = "invalid-profile-id"
-        with self.assertRaises(Exception) as context:
+        with self.assertRaises(ValidationError) as context:
             self.api.get_profile(profile_id)
 
-        self.assertTrue("validation error" in str(context.exception).lower())
-
-
-if __name__ == "__main__":
-    unittest.main()
+        self.assertGreater(context.exception.error_count(), 0)